@@ -20,16 +20,33 @@ NC='\033[0m' # No Color
 
 # Load configuration
 load_config() {
-    # Try .env file first
-    if [ -f "$ENV_FILE" ]; then
-        export $(grep -v '^#' "$ENV_FILE" | xargs)
-    fi
-    
-    # Override with config file if exists
-    if [ -f "$CONFIG_FILE" ]; then
-        source "$CONFIG_FILE"
+    # Already resolved this run - nothing to probe again. The sentinel is
+    # script-private on purpose: keying off BASE_URL would let a generic
+    # exported variable of that name skip the dependency and credential
+    # checks entirely
+    [ -n "$MITE_CONFIG_LOADED" ] && return 0
+
+    # Commands that reach the API all pass through here, so this is the
+    # one place the jq/curl check is needed; usage and config skip it
+    check_dependencies
+
+    # Credentials already in the environment? Skip the file probes entirely
+    if [ -z "$MITE_ACCOUNT" ] || [ -z "$MITE_API_KEY" ]; then
+        # Try .env file first; set -a exports everything the file assigns,
+        # which unlike the old grep|xargs pipeline survives quoted values
+        # and spaces
+        if [ -f "$ENV_FILE" ]; then
+            set -a
+            . "$ENV_FILE"
+            set +a
+        fi
+
+        # Override with config file if exists
+        if [ -f "$CONFIG_FILE" ]; then
+            source "$CONFIG_FILE"
+        fi
     fi
-    
+
     # Check if credentials are set
     if [ -z "$MITE_ACCOUNT" ] || [ -z "$MITE_API_KEY" ]; then
         echo -e "${RED}Error: Mite credentials not configured.${NC}"
@@ -41,6 +58,27 @@ load_config() {
     fi
     
     BASE_URL="https://${MITE_ACCOUNT}.mite.de"
+
+    # Per-transfer curl options shared by every call path; defined once
+    # here so compression, timeouts and auth headers cannot drift apart
+    CURL_OPTS=(
+        -s
+        --compressed
+        --connect-timeout 5
+        --max-time 60
+        -H "X-MiteApiKey: $MITE_API_KEY"
+        -H "Content-Type: application/json"
+        -H "User-Agent: MiteCLI-Shell/1.0"
+    )
+
+    # Negotiate HTTP/2 when this curl build supports it: the batched
+    # multi-transfer calls (prefetch, batch add) then multiplex on one
+    # stream instead of serializing request/response pairs
+    if curl --version 2>/dev/null | grep -q HTTP2; then
+        CURL_OPTS+=(--http2)
+    fi
+
+    MITE_CONFIG_LOADED=1
 }
 
 # Parse duration (2h, 90m, 1h30m, 90)
@@ -48,33 +86,37 @@ parse_duration() {
     local duration="$1"
     local minutes=0
     
-    # Direct minutes
-    if [[ "$duration" =~ ^[0-9]+$ ]]; then
-        minutes=$duration
-    # Decimal hours (1.5h)
-    elif [[ "$duration" =~ ^([0-9]+\.?[0-9]*)h$ ]]; then
-        local hours="${BASH_REMATCH[1]}"
-        minutes=$(echo "$hours * 60" | bc | cut -d. -f1)
-    # Hours and minutes (1h30m)
-    elif [[ "$duration" =~ ^([0-9]+)h([0-9]+)m?$ ]]; then
-        local hours="${BASH_REMATCH[1]}"
-        local mins="${BASH_REMATCH[2]}"
-        minutes=$((hours * 60 + mins))
-    # Just hours (2h)
-    elif [[ "$duration" =~ ^([0-9]+)h$ ]]; then
-        local hours="${BASH_REMATCH[1]}"
-        minutes=$((hours * 60))
-    # Just minutes (90m)
-    elif [[ "$duration" =~ ^([0-9]+)m$ ]]; then
-        minutes="${BASH_REMATCH[1]}"
+    # One anchored pattern covers every accepted form - 90, 90m, 2h, 1.5h,
+    # 1h30m, 1h30 - so a valid duration is recognized in a single match
+    # instead of walking a ladder of per-format branches
+    if [ -n "$duration" ] && [[ "$duration" =~ ^(([0-9]+)(\.([0-9]+))?h)?(([0-9]+)m?)?$ ]]; then
+        local hours="${BASH_REMATCH[2]:-0}"
+        local frac="${BASH_REMATCH[4]}"
+        local mins="${BASH_REMATCH[6]:-0}"
+        minutes=$((10#$hours * 60 + 10#$mins))
+        # Fractional hours scale by digit count (5 -> 30m, 25 -> 15m)
+        if [ -n "$frac" ]; then
+            minutes=$((minutes + 10#$frac * 60 / 10 ** ${#frac}))
+        fi
     else
-        echo -e "${RED}Error: Invalid duration format: $duration${NC}"
-        exit 1
+        # Error goes to stderr so callers capturing stdout get nothing,
+        # and return (not exit) so the caller decides whether to abort
+        echo -e "${RED}Error: Invalid duration format: $duration${NC}" >&2
+        return 1
     fi
-    
+
     echo $minutes
 }
 
+# Validate a YYYY-MM-DD date string; pure shell regex plus a cheap range
+# check on month and day, no date(1) fork
+validate_date() {
+    [[ "$1" =~ ^[0-9]{4}-([0-9]{2})-([0-9]{2})$ ]] || return 1
+    local month=$((10#${BASH_REMATCH[1]}))
+    local day=$((10#${BASH_REMATCH[2]}))
+    [ "$month" -ge 1 ] && [ "$month" -le 12 ] && [ "$day" -ge 1 ] && [ "$day" -le 31 ]
+}
+
 # Format minutes to human readable
 format_duration() {
     local minutes=$1
@@ -92,139 +134,489 @@ format_duration() {
     fi
 }
 
+# jq-side counterpart of format_duration, defined once and prepended to
+# every jq program that renders durations so the two cannot drift apart
+readonly JQ_FMTDUR='def fmtdur: (. / 60 | floor) as $h | (. % 60) as $m |
+    if $h > 0 then (if $m > 0 then "\($h)h \($m)m" else "\($h)h" end)
+    else "\($m)m" end;'
+
 # Make API request
 api_request() {
     local method="$1"
     local endpoint="$2"
     local data="$3"
-    
+    # Any further arguments are passed to curl as-is (e.g. ETag flags)
+    local extra=("${@:4}")
+
     local url="${BASE_URL}${endpoint}"
-    local headers=(
-        -H "X-MiteApiKey: $MITE_API_KEY"
-        -H "Content-Type: application/json"
-        -H "User-Agent: MiteCLI-Shell/1.0"
-    )
-    
+    local opts=("${CURL_OPTS[@]}" "${extra[@]}")
+
+    # Retry transient failures with backoff, but only for GETs - a retried
+    # POST could create a duplicate time entry
+    if [ "$method" = "GET" ]; then
+        opts+=(--retry 2 --retry-delay 1)
+    fi
+
     if [ -n "$data" ]; then
-        curl -s -X "$method" "${headers[@]}" -d "$data" "$url"
+        curl "${opts[@]}" -X "$method" -d "$data" "$url"
     else
-        curl -s -X "$method" "${headers[@]}" "$url"
+        curl "${opts[@]}" -X "$method" "$url"
     fi
 }
 
-# List projects
-list_projects() {
-    echo -e "${BOLD}Available Projects:${NC}"
-    api_request GET "/projects.json" | jq -r '.[] | "  ID: \(.project.id) - \(.project.name)"'
+# Ensure a fetched body is the JSON array the list endpoints return.
+# Anything else - empty (curl failed after retries) or an {"error": ...}
+# object (bad credentials) - prints the API's message and fails, so
+# callers can bail out before feeding it to a formatter
+require_array_body() {
+    local body="$1"
+    local what="$2"
+    # The explicit emptiness check matters: jq -e exits 0 on empty input
+    if [ -n "$body" ] && echo "$body" | jq -e 'type == "array"' >/dev/null 2>&1; then
+        return 0
+    fi
+    local msg=$(echo "$body" | jq -r '.error // empty' 2>/dev/null)
+    echo -e "${RED}Error fetching $what: ${msg:-empty response}${NC}" >&2
+    return 1
 }
 
-# List services
-list_services() {
-    echo -e "${BOLD}Available Services:${NC}"
-    api_request GET "/services.json" | jq -r '.[] | "  ID: \(.service.id) - \(.service.name)"'
+# Per-run response caches, so one invocation never fetches the same list twice
+PROJECTS_CACHE=""
+SERVICES_CACHE=""
+
+# Disk cache for project/service lists - they change rarely, so reuse them
+# across invocations within a freshness window
+CACHE_DIR="$HOME/.mite_cache"
+CACHE_TTL="${MITE_CACHE_TTL:-1800}"
+NO_CACHE=false
+
+# Path of the disk cache file for a resource (projects or services)
+cache_file() {
+    echo "$CACHE_DIR/${MITE_ACCOUNT}_$1.json"
 }
 
-# Find project by name
-find_project_id() {
-    local name="$1"
-    local name_lower=$(echo "$name" | tr '[:upper:]' '[:lower:]')
-    
-    # Try exact match first
-    local id=$(api_request GET "/projects.json" | jq -r --arg name "$name_lower" '.[] | select(.project.name | ascii_downcase == $name) | .project.id' | head -1)
-    
-    # If no exact match, try partial match
-    if [ -z "$id" ]; then
-        id=$(api_request GET "/projects.json" | jq -r --arg name "$name_lower" '.[] | select(.project.name | ascii_downcase | contains($name)) | .project.id' | head -1)
+# Check whether a cache file exists and is younger than CACHE_TTL seconds
+cache_fresh() {
+    local file="$1"
+    [ -f "$file" ] || return 1
+    # GNU stat (Linux) first, then BSD stat (macOS); GNU also accepts -f
+    # but treats it as a filesystem query, so -c must be tried first
+    local mtime=$(stat -c %Y "$file" 2>/dev/null || stat -f %m "$file" 2>/dev/null)
+    [[ "$mtime" =~ ^[0-9]+$ ]] || return 1
+    [ $(( $(date +%s) - mtime )) -lt "$CACHE_TTL" ]
+}
+
+# Validate a fetched tmp file and move it into place atomically as the
+# cache for a resource; refuses to install anything but a JSON array
+install_cache_file() {
+    local resource="$1"
+    local tmp="$2"
+    # -s guards the empty file case: jq -e exits 0 on empty input
+    if [ -s "$tmp" ] && jq -e 'type == "array"' "$tmp" > /dev/null 2>&1; then
+        chmod 600 "$tmp"
+        mv "$tmp" "$(cache_file "$resource")"
+    else
+        rm -f "$tmp"
+        return 1
     fi
-    
-    echo "$id"
 }
 
-# Find service by name
-find_service_id() {
-    local name="$1"
+# Remove all cached lists (use after renaming projects/services in Mite)
+clear_cache() {
+    rm -f "$CACHE_DIR"/*.json "$CACHE_DIR"/*.etag 2>/dev/null || true
+    echo -e "${GREEN}Cache cleared${NC}"
+}
+
+# Fill ETAG_OPTS with the curl flags that revalidate a resource's cached
+# body: always save the response ETag, and send If-None-Match when we
+# still hold both the body and its ETag
+set_etag_opts() {
+    local resource="$1"
+    local etag_file="$CACHE_DIR/${MITE_ACCOUNT}_${resource}.etag"
+    ETAG_OPTS=(--etag-save "$etag_file")
+    if [ -f "$(cache_file "$resource")" ] && [ -s "$etag_file" ]; then
+        ETAG_OPTS+=(--etag-compare "$etag_file")
+    fi
+}
+
+# Install a fetched body; an empty body means 304 Not Modified, so the
+# cached copy is still current and only its timestamp needs refreshing
+finish_refresh() {
+    local resource="$1"
+    local tmp="$2"
+    if [ -s "$tmp" ]; then
+        install_cache_file "$resource" "$tmp" || true
+    else
+        rm -f "$tmp"
+        if [ -f "$(cache_file "$resource")" ]; then
+            touch "$(cache_file "$resource")"
+        fi
+    fi
+}
+
+# Refresh a resource's disk cache from the API
+refresh_resource_cache() {
+    local resource="$1"
+    mkdir -p "$CACHE_DIR"
+    local tmp="$CACHE_DIR/${resource}.tmp.$$"
+    set_etag_opts "$resource"
+    api_request GET "/${resource}.json" "" "${ETAG_OPTS[@]}" > "$tmp" || true
+    finish_refresh "$resource" "$tmp"
+}
+
+# Warm both disk caches. When both lists are stale, fetch them with a
+# single curl process: curl requests the second URL over the same TLS
+# connection (multiplexed where the server allows it), so two lists cost
+# one handshake
+prefetch_resources() {
+    [ "$NO_CACHE" = true ] && return 0
+    local need_projects=false
+    local need_services=false
+    cache_fresh "$(cache_file projects)" || need_projects=true
+    cache_fresh "$(cache_file services)" || need_services=true
+
+    if [ "$need_projects" = true ] && [ "$need_services" = true ]; then
+        mkdir -p "$CACHE_DIR"
+        local ptmp="$CACHE_DIR/projects.tmp.$$"
+        local stmp="$CACHE_DIR/services.tmp.$$"
+        set_etag_opts projects
+        local popts=("${ETAG_OPTS[@]}")
+        set_etag_opts services
+        local sopts=("${ETAG_OPTS[@]}")
+        # --next keeps the transfers on one connection while giving each
+        # its own ETag flags and output file
+        curl "${CURL_OPTS[@]}" --retry 2 --retry-delay 1 "${popts[@]}" \
+                -o "$ptmp" "${BASE_URL}/projects.json" \
+            --next "${CURL_OPTS[@]}" --retry 2 --retry-delay 1 "${sopts[@]}" \
+                -o "$stmp" "${BASE_URL}/services.json" || true
+        finish_refresh projects "$ptmp"
+        finish_refresh services "$stmp"
+    elif [ "$need_projects" = true ]; then
+        refresh_resource_cache projects
+    elif [ "$need_services" = true ]; then
+        refresh_resource_cache services
+    fi
+}
+
+# Fetch a resource list into the per-run cache (no-op if already loaded)
+fetch_resource() {
+    local resource="$1"
+    case "$resource" in
+        projects) [ -n "$PROJECTS_CACHE" ] && return 0 ;;
+        services) [ -n "$SERVICES_CACHE" ] && return 0 ;;
+    esac
+
+    local data=""
+    local file=$(cache_file "$resource")
+    if [ "$NO_CACHE" = false ]; then
+        cache_fresh "$file" || refresh_resource_cache "$resource"
+        if cache_fresh "$file"; then
+            data=$(cat "$file")
+        fi
+    fi
+    [ -n "$data" ] || data=$(api_request GET "/${resource}.json")
+
+    case "$resource" in
+        projects) PROJECTS_CACHE="$data" ;;
+        services) SERVICES_CACHE="$data" ;;
+    esac
+}
+
+fetch_projects() { fetch_resource projects; }
+fetch_services() { fetch_resource services; }
+
+# List a resource: list_resource <projects|services> <label>
+list_resource() {
+    local resource="$1"
+    local label="$2"
+    local key="${resource%s}"
+
+    fetch_resource "$resource"
+
+    local data
+    case "$resource" in
+        projects) data="$PROJECTS_CACHE" ;;
+        services) data="$SERVICES_CACHE" ;;
+    esac
+
+    echo -e "${BOLD}Available $label:${NC}"
+    echo "$data" | jq -r --arg key "$key" '.[] | "  ID: \(.[$key].id) - \(.[$key].name)"'
+}
+
+list_projects() { list_resource projects "Projects"; }
+list_services() { list_resource services "Services"; }
+
+# Find a resource id by name: find_resource_id <projects|services> <name>
+find_resource_id() {
+    local resource="$1"
+    local name="$2"
+    local key="${resource%s}"
+
+    # A numeric "name" is already an id - no list fetch, no scan
+    if [[ "$name" =~ ^[0-9]+$ ]]; then
+        echo "$name"
+        return 0
+    fi
+
     local name_lower=$(echo "$name" | tr '[:upper:]' '[:lower:]')
-    
-    # Try exact match first
-    local id=$(api_request GET "/services.json" | jq -r --arg name "$name_lower" '.[] | select(.service.name | ascii_downcase == $name) | .service.id' | head -1)
-    
-    # If no exact match, try partial match
-    if [ -z "$id" ]; then
-        id=$(api_request GET "/services.json" | jq -r --arg name "$name_lower" '.[] | select(.service.name | ascii_downcase | contains($name)) | .service.id' | head -1)
+
+    fetch_resource "$resource"
+
+    # Exact match wins over partial match; first() stops at the first hit,
+    # and both passes run in a single jq invocation
+    local filter='
+        (first(.[] | select(.[$key].name | ascii_downcase == $name))
+         // first(.[] | select(.[$key].name | ascii_downcase | contains($name)))
+         // empty) | .[$key].id'
+
+    # Let jq stream the cache file directly when there is one, instead of
+    # copying the whole body through the shell
+    local id
+    local file=$(cache_file "$resource")
+    if [ "$NO_CACHE" = false ] && [ -f "$file" ]; then
+        id=$(jq -r --arg name "$name_lower" --arg key "$key" "$filter" "$file")
+    else
+        local data
+        case "$resource" in
+            projects) data="$PROJECTS_CACHE" ;;
+            services) data="$SERVICES_CACHE" ;;
+        esac
+        id=$(echo "$data" | jq -r --arg name "$name_lower" --arg key "$key" "$filter")
     fi
-    
+
     echo "$id"
 }
 
-# Add time entry
-add_entry() {
+find_project_id() { find_resource_id projects "$1"; }
+find_service_id() { find_resource_id services "$1"; }
+
+# Build a time-entry payload (single line of JSON on stdout); all
+# validation/resolution errors go to stderr so callers capturing the
+# payload see nothing on failure
+build_entry_payload() {
     local duration="$1"
     local note="$2"
     local date="$3"
     local project="$4"
     local service="$5"
-    
-    local minutes=$(parse_duration "$duration")
-    
-    # Build JSON payload
-    local json="{\"time_entry\": {\"minutes\": $minutes, \"note\": \"$note\""
-    
-    if [ -n "$date" ]; then
-        json="$json, \"date_at\": \"$date\""
+
+    local minutes
+    minutes=$(parse_duration "$duration") || return 1
+
+    # Reject malformed dates locally instead of round-tripping to the API
+    if [ -n "$date" ] && ! validate_date "$date"; then
+        echo -e "${RED}Error: Date must be in YYYY-MM-DD format: $date${NC}" >&2
+        return 1
     fi
-    
-    # Handle project
+
+    # When both a project and a service name need resolving, warm both
+    # caches in parallel instead of fetching the lists one after the other
+    if [ -n "$project" ] && [[ ! "$project" =~ ^[0-9]+$ ]] && \
+       [ -n "$service" ] && [[ ! "$service" =~ ^[0-9]+$ ]]; then
+        prefetch_resources
+    fi
+
+    # Resolve project to an id (numeric input passes straight through)
+    local project_id=""
     if [ -n "$project" ]; then
-        if [[ "$project" =~ ^[0-9]+$ ]]; then
-            json="$json, \"project_id\": $project"
-        else
-            local project_id=$(find_project_id "$project")
-            if [ -z "$project_id" ]; then
-                echo -e "${RED}Error: No project found matching '$project'${NC}"
-                list_projects
-                exit 1
-            fi
-            json="$json, \"project_id\": $project_id"
+        if [[ ! "$project" =~ ^[0-9]+$ ]]; then
+            # Populate the cache here so the lookup (and the project list
+            # shown on failure) share a single fetch
+            fetch_projects
+        fi
+        project_id=$(find_project_id "$project")
+        if [ -z "$project_id" ]; then
+            echo -e "${RED}Error: No project found matching '$project'${NC}" >&2
+            list_projects >&2
+            return 1
         fi
     fi
-    
-    # Handle service
+
+    # Resolve service to an id (numeric input passes straight through)
+    local service_id=""
     if [ -n "$service" ]; then
-        if [[ "$service" =~ ^[0-9]+$ ]]; then
-            json="$json, \"service_id\": $service"
-        else
-            local service_id=$(find_service_id "$service")
-            if [ -z "$service_id" ]; then
-                echo -e "${RED}Error: No service found matching '$service'${NC}"
-                list_services
-                exit 1
-            fi
-            json="$json, \"service_id\": $service_id"
+        if [[ ! "$service" =~ ^[0-9]+$ ]]; then
+            # Populate the cache here so the lookup (and the service list
+            # shown on failure) share a single fetch
+            fetch_services
+        fi
+        service_id=$(find_service_id "$service")
+        if [ -z "$service_id" ]; then
+            echo -e "${RED}Error: No service found matching '$service'${NC}" >&2
+            list_services >&2
+            return 1
         fi
     fi
-    
-    json="$json}}"
-    
-    # Create entry
-    local response=$(api_request POST "/time_entries.json" "$json")
-    
-    if [ $? -eq 0 ] && [ -n "$response" ]; then
-        echo -e "${GREEN}✓ Time entry created successfully!${NC}"
-        echo -e "  Date: $(echo "$response" | jq -r '.time_entry.date_at')"
-        echo -e "  Duration: $(format_duration $minutes)"
-        echo -e "  Note: $(echo "$response" | jq -r '.time_entry.note')"
-        
-        local project_name=$(echo "$response" | jq -r '.time_entry.project_name // empty')
+
+    # Build the payload with jq: notes are escaped properly (quotes and
+    # backslashes used to break the hand-built string) and empty optional
+    # fields are simply dropped from the object
+    jq -cn \
+        --argjson minutes "$minutes" \
+        --arg note "$note" \
+        --arg date "$date" \
+        --arg project_id "$project_id" \
+        --arg service_id "$service_id" \
+        '{time_entry: ({minutes: $minutes, note: $note}
+            + (if $date != "" then {date_at: $date} else {} end)
+            + (if $project_id != "" then {project_id: ($project_id | tonumber)} else {} end)
+            + (if $service_id != "" then {service_id: ($service_id | tonumber)} else {} end))}'
+}
+
+# Print the outcome of one create response; returns 1 if no entry was made
+report_create_response() {
+    local response="$1"
+
+    # One decode both classifies the response and extracts the fields -
+    # no separate probe-only jq pass. On success the note comes last so
+    # it may safely span multiple lines; on failure the API error
+    # message takes its place
+    local parsed
+    parsed=$(echo "$response" | jq -r '
+        if .time_entry.id then
+            "OK", .time_entry.date_at, (.time_entry.minutes // 0),
+            (.time_entry.project_name // ""), (.time_entry.service_name // ""),
+            (.time_entry.note // "")
+        else
+            "ERR", (.error // "")
+        end' 2>/dev/null) || parsed="ERR"
+
+    local status entry_date entry_minutes project_name service_name entry_note api_error
+    {
+        read -r status
+        if [ "$status" = "OK" ]; then
+            read -r entry_date
+            read -r entry_minutes
+            read -r project_name
+            read -r service_name
+            entry_note=$(cat)
+        else
+            api_error=$(cat)
+        fi
+    } <<< "$parsed"
+
+    if [ "$status" = "OK" ]; then
+        # Assemble the confirmation in one buffer and write it once
+        local out="${GREEN}✓ Time entry created successfully!${NC}\\n"
+        out="${out}  Date: $entry_date\\n"
+        out="${out}  Duration: $(format_duration $entry_minutes)\\n"
+        out="${out}  Note: $entry_note\\n"
+
         if [ -n "$project_name" ]; then
-            echo -e "  Project: $project_name"
+            out="${out}  Project: $project_name\\n"
         fi
-        
-        local service_name=$(echo "$response" | jq -r '.time_entry.service_name // empty')
+
         if [ -n "$service_name" ]; then
-            echo -e "  Service: $service_name"
+            out="${out}  Service: $service_name\\n"
         fi
+
+        printf '%b' "$out"
     else
         echo -e "${RED}Error creating time entry${NC}"
+        if [ -n "$api_error" ]; then
+            echo -e "  $api_error"
+        fi
+        return 1
+    fi
+}
+
+# Add time entry
+add_entry() {
+    local json
+    json=$(build_entry_payload "$1" "$2" "$3" "$4" "$5") || exit 1
+
+    # Create entry
+    local response
+    response=$(api_request POST "/time_entries.json" "$json") || response=""
+
+    report_create_response "$response" || exit 1
+}
+
+# POST many payloads (one per line on stdin) through a single curl
+# process: every transfer after the first reuses the established TLS
+# connection. Responses come back compacted, one per line, in order
+post_entries() {
+    local url="${BASE_URL}/time_entries.json"
+    local args=()
+    local payload
+    while IFS= read -r payload; do
+        [ -z "$payload" ] && continue
+        if [ ${#args[@]} -gt 0 ]; then
+            args+=(--next)
+        fi
+        # --next resets per-transfer options, so each segment carries the
+        # full set
+        args+=("${CURL_OPTS[@]}" -X POST -d "$payload" "$url")
+    done
+    [ ${#args[@]} -eq 0 ] && return 0
+    curl "${args[@]}" | jq -c '.'
+}
+
+# Add many entries from a file or stdin; one line per entry:
+#   duration|note|date|project|service   (date/project/service optional)
+add_batch() {
+    local file="${1:--}"
+    local total=0
+    local failed=0
+
+    # Fail fast on a typo'd filename instead of running an empty batch
+    # that ends with a green summary
+    if [ "$file" != - ] && [ ! -r "$file" ]; then
+        echo -e "${RED}Error: Cannot read batch file '$file'${NC}" >&2
+        exit 1
+    fi
+
+    # Warm both caches once up front so every row resolves names locally
+    # instead of paying a list fetch per entry
+    prefetch_resources
+
+    # First pass: build every payload. A row that fails validation or
+    # name resolution reports its error and is skipped; the batch goes on
+    local payloads=()
+    local duration note date project service payload
+    # "|| [ -n ... ]" keeps a final row without a trailing newline: read
+    # returns non-zero at EOF even though it filled the fields
+    while IFS='|' read -r duration note date project service || [ -n "$duration" ]; do
+        # Skip blank lines and comment lines
+        [ -z "$duration" ] && continue
+        case "$duration" in \#*) continue ;; esac
+
+        total=$((total + 1))
+        if payload=$(build_entry_payload "$duration" "$note" "$date" "$project" "$service"); then
+            payloads+=("$payload")
+        else
+            failed=$((failed + 1))
+        fi
+    done < <(cat -- "$file")
+
+    # Second pass: POST all payloads through one curl process, so every
+    # create after the first rides the same TLS connection, and report
+    # each response as it streams back
+    if [ ${#payloads[@]} -gt 0 ]; then
+        local response
+        local responses=0
+        while IFS= read -r response; do
+            responses=$((responses + 1))
+            if ! report_create_response "$response"; then
+                failed=$((failed + 1))
+            fi
+        done < <(printf '%s\n' "${payloads[@]}" | post_entries)
+
+        # Payloads without a response line (curl aborted mid-run, or a
+        # malformed response stopped the decoder) were never confirmed
+        # created - count them as failures rather than reporting success
+        local missing=$((${#payloads[@]} - responses))
+        if [ $missing -gt 0 ]; then
+            echo -e "${RED}Error: no response for $missing entries${NC}" >&2
+            failed=$((failed + missing))
+        fi
+    fi
+
+    echo ""
+    if [ $failed -eq 0 ]; then
+        echo -e "${GREEN}Batch complete: $total entries created${NC}"
+    else
+        echo -e "${YELLOW}Batch complete: $((total - failed)) created, $failed failed${NC}"
         exit 1
     fi
 }
@@ -235,12 +627,21 @@ display_calendar() {
     local year="$2"
     local month="$3"
     local month_name="$4"
-    
-    echo -e "\n${BOLD}📅 $month_name $year${NC}"
-    echo "+------------+------------+------------+------------+------------+------------+------------+"
-    echo "|    Mon     |    Tue     |    Wed     |    Thu     |    Fri     |    Sat     |    Sun     |"
-    echo "+------------+------------+------------+------------+------------+------------+------------+"
-    
+
+    # Normalize to plain numbers: date(1) emits zero-padded months, and
+    # arithmetic/printf would read 08/09 as invalid octal
+    year=$((10#$year))
+    month=$((10#$month))
+
+    # Whole view is accumulated here and flushed with a single printf at
+    # the end, instead of one write per row/summary line
+    local border="+------------+------------+------------+------------+------------+------------+------------+"
+    local out="\n${BOLD}📅 $month_name $year${NC}\n"
+    out+="${border}\n"
+    out+="|    Mon     |    Tue     |    Wed     |    Thu     |    Fri     |    Sat     |    Sun     |\n"
+    out+="${border}\n"
+
+
     # Get first day of month (0=Sunday, 1=Monday, etc)
     # BSD date (macOS) compatible
     local first_day=$(date -j -f "%Y-%m-%d" "$year-$month-01" +%w 2>/dev/null || date -d "$year-$month-01" +%w 2>/dev/null)
@@ -257,82 +658,118 @@ display_calendar() {
         days_in_month=$(date -d "$year-$month-01 +1 month -1 day" +%d)
     fi
     
+    # Sum minutes per day of month in a single jq pass; the plain indexed
+    # arrays make the per-cell lookups below free variable expansions
+    # instead of a jq process (and a format_duration fork) per day
+    local daily_minutes=()
+    local daily_dur=()
+    local d m f
+    while read -r d m f; do
+        daily_minutes[$((10#$d))]=$m
+        daily_dur[$((10#$d))]="$f"
+    done < <(echo "$entries" | jq -r "$JQ_FMTDUR"'
+        reduce .[] as $e ({}; .[$e.time_entry.date_at] += $e.time_entry.minutes)
+        | to_entries[] | "\(.key[8:10]) \(.value) \(.value | fmtdur)"')
+
+    # Loop invariants hoisted out of the grid: today only changes once a
+    # day, not once a cell
+    local today=$(date +%Y-%m-%d)
+
+    # Static cell fragments built once; cells are assembled below with
+    # printf -v, so no command substitution forks inside the grid loop
+    local empty_cell="|            "
+    local glyph_full="${GREEN}✓${NC}"
+    local glyph_part="${YELLOW}◐${NC}"
+    local glyph_short="${RED}○${NC}"
+    local cell_off="${BOLD}${RED}✗ OFF${NC}   "
+    local daypad durpad
+
     local day=1
     local off_days=""
-    
+
     # Create calendar rows
     while [ $day -le $days_in_month ]; do
         local week=""
         for dow in {0..6}; do
             if [ $day -eq 1 ] && [ $dow -lt $first_day ]; then
                 # Empty cell before month starts
-                week="${week}|            "
+                week="${week}${empty_cell}"
             elif [ $day -le $days_in_month ]; then
-                local date_str=$(printf "%04d-%02d-%02d" $year $month $day)
-                
-                # Check if we have data for this date (sum all entries for the date)
-                local minutes=$(echo "$entries" | jq --arg date "$date_str" '[.[] | select(.time_entry.date_at == $date) | .time_entry.minutes] | add // empty' | grep -v "null")
-                
-                if [ -n "$minutes" ] && [ "$minutes" != "null" ]; then
+                # Check if we have data for this date (precomputed above)
+                local minutes="${daily_minutes[$day]:-}"
+                printf -v daypad "%2d" $day
+
+                if [ -n "$minutes" ]; then
                     local hours=$((minutes / 60))
-                    local duration=$(format_duration $minutes)
-                    local dur_short="${duration:0:5}"
-                    
+                    printf -v durpad "%-5s" "${daily_dur[$day]:0:5}"
+
                     # Create cell content with padding
                     if [ $hours -ge 8 ]; then
-                        week="${week}| $(printf "%2d" $day) ${GREEN}✓${NC} $(printf "%-5s" "$dur_short") "
+                        week="${week}| $daypad $glyph_full $durpad "
                     elif [ $hours -ge 6 ]; then
-                        week="${week}| $(printf "%2d" $day) ${YELLOW}◐${NC} $(printf "%-5s" "$dur_short") "
+                        week="${week}| $daypad $glyph_part $durpad "
                     else
-                        week="${week}| $(printf "%2d" $day) ${RED}○${NC} $(printf "%-5s" "$dur_short") "
+                        week="${week}| $daypad $glyph_short $durpad "
                     fi
                 else
-                    # No entry for this date
-                    local day_of_week=$(date -j -f "%Y-%m-%d" "$date_str" +%w 2>/dev/null || date -d "$date_str" +%w 2>/dev/null || echo 0)
-                    if [ -n "$day_of_week" ] && [ "$day_of_week" -ge 1 ] && [ "$day_of_week" -le 5 ]; then
-                        # Working day
-                        if [[ "$date_str" < "$(date +%Y-%m-%d)" ]]; then
-                            week="${week}| $(printf "%2d" $day) ${BOLD}${RED}✗ OFF${NC}   "
+                    # No entry for this date. The column index already
+                    # encodes the weekday (0=Mon .. 6=Sun), so no date(1)
+                    # fork is needed to classify working days
+                    if [ $dow -le 4 ]; then
+                        # Working day; printf -v formats without a fork
+                        local date_str
+                        printf -v date_str "%04d-%02d-%02d" $year $month $day
+                        if [[ "$date_str" < "$today" ]]; then
+                            week="${week}| $daypad $cell_off"
                             off_days="${off_days}${day}/${month} "
                         else
-                            week="${week}| ${CYAN}$(printf "%2d" $day)${NC}         "
+                            week="${week}| ${CYAN}${daypad}${NC}         "
                         fi
                     else
                         # Weekend
-                        week="${week}| ${CYAN}$(printf "%2d" $day)${NC}         "
+                        week="${week}| ${CYAN}${daypad}${NC}         "
                     fi
                 fi
                 ((day++))
             else
                 # Empty cell after month ends
-                week="${week}|            "
+                week="${week}${empty_cell}"
             fi
         done
-        echo -e "${week}|"
+        out+="${week}|\n"
     done
-    
-    echo "+------------+------------+------------+------------+------------+------------+------------+"
-    
-    # Summary
-    local total_minutes=$(echo "$entries" | jq '[.[] | .time_entry.minutes] | add // 0')
-    local days_worked=$(echo "$entries" | jq '[.[] | .time_entry.date_at] | unique | length // 0')
-    
-    echo -e "\n${BOLD}📊 Summary${NC}"
-    echo "─────────────────────────────────────"
+
+    out+="${border}\n"
+
+    # Summary: one jq pass folding total and distinct days with reduce,
+    # without materializing intermediate per-entry arrays. The fallback
+    # keeps the buffered calendar flushing below even if the decode
+    # produces nothing - without it, set -e would abort mid-render
+    local total_minutes days_worked
+    read -r total_minutes days_worked < <(echo "$entries" | jq -r '
+        (reduce .[] as $e (0; . + ($e.time_entry.minutes // 0))) as $total
+        | (reduce .[] as $e ({}; .[$e.time_entry.date_at] = 1) | length) as $days
+        | "\($total) \($days)"' 2>/dev/null) || { total_minutes=0; days_worked=0; }
+    total_minutes=${total_minutes:-0}
+    days_worked=${days_worked:-0}
+
+    out+="\n${BOLD}📊 Summary${NC}\n"
+    out+="─────────────────────────────────────\n"
     if [ "$total_minutes" -gt 0 ] && [ "$days_worked" -gt 0 ]; then
         local avg_minutes=$((total_minutes / days_worked))
-        echo -e "${BOLD}Total Time:${NC} $(format_duration $total_minutes)"
-        echo -e "${BOLD}Average per Day:${NC} $(format_duration $avg_minutes)"
-        echo -e "${BOLD}Days Worked:${NC} $days_worked"
+        out+="${BOLD}Total Time:${NC} $(format_duration $total_minutes)\n"
+        out+="${BOLD}Average per Day:${NC} $(format_duration $avg_minutes)\n"
+        out+="${BOLD}Days Worked:${NC} $days_worked\n"
         if [ -n "$off_days" ]; then
             local off_count=$(echo $off_days | wc -w)
-            echo -e "${BOLD}${RED}Off Days:${NC} $off_count days"
-            echo -e "${CYAN}Dates: ${off_days}${NC}"
+            out+="${BOLD}${RED}Off Days:${NC} $off_count days\n"
+            out+="${CYAN}Dates: ${off_days}${NC}\n"
         fi
     else
-        echo "No time entries found"
+        out+="No time entries found\n"
     fi
-    echo "─────────────────────────────────────"
+    out+="─────────────────────────────────────\n"
+    printf '%b' "$out"
 }
 
 # View timesheet
@@ -373,45 +810,66 @@ view_timesheet() {
             ;;
     esac
     
-    # Add project filter
+    # Add project filter; find_project_id passes numeric IDs straight
+    # through, so both forms resolve the same way
     if [ -n "$project_filter" ]; then
-        if [[ "$project_filter" =~ ^[0-9]+$ ]]; then
-            params="${params}&project_id=$project_filter"
-        else
-            local project_id=$(find_project_id "$project_filter")
-            if [ -n "$project_id" ]; then
-                params="${params}&project_id=$project_id"
-            fi
+        local project_id=$(find_project_id "$project_filter")
+        if [ -n "$project_id" ]; then
+            params="${params}&project_id=$project_id"
         fi
     fi
     
-    local entries=$(api_request GET "/time_entries.json${params}&limit=100")
-    
     # For monthly view, show calendar
     if [ "$is_monthly" = true ]; then
+        local entries
+        entries=$(api_request GET "/time_entries.json${params}&limit=100") || entries=""
+        require_array_body "$entries" "time entries" || exit 1
+
         # Get year and month from first entry or use current
         local first_date=$(echo "$entries" | jq -r '.[0].time_entry.date_at // empty')
+        local year month month_name
         if [ -n "$first_date" ]; then
-            # BSD date (macOS) compatible
-            local year=$(date -j -f "%Y-%m-%d" "$first_date" +%Y 2>/dev/null || date -d "$first_date" +%Y 2>/dev/null)
-            local month=$(date -j -f "%Y-%m-%d" "$first_date" +%m 2>/dev/null || date -d "$first_date" +%m 2>/dev/null)
-            local month_name=$(date -j -f "%Y-%m-%d" "$first_date" +%B 2>/dev/null || date -d "$first_date" +%B 2>/dev/null)
+            # One date(1) run parses first_date once for all three fields
+            # (BSD date on macOS, GNU date fallback)
+            read -r year month month_name < <(
+                date -j -f "%Y-%m-%d" "$first_date" +"%Y %m %B" 2>/dev/null ||
+                date -d "$first_date" +"%Y %m %B" 2>/dev/null)
         else
-            local year=$(date +%Y)
-            local month=$(date +%m)
-            local month_name=$(date +%B)
+            read -r year month month_name < <(date +"%Y %m %B")
         fi
         
         display_calendar "$entries" "$year" "$month" "$month_name"
     else
-        # Regular list view
+        # Regular list view. Fetch and validate before printing anything,
+        # so bad credentials or a dead network exit 1 with the API's
+        # message instead of a bare header and exit 0
+        local entries
+        entries=$(api_request GET "/time_entries.json${params}&limit=100") || entries=""
+        require_array_body "$entries" "time entries" || exit 1
+
         echo -e "\n${BOLD}⏰ Timesheet - $title${NC}"
         echo "============================================"
-        
-        local total_minutes=0
+
+        # One jq pass over the validated body emits an E-row per entry
+        # plus a trailing T-row carrying the total, so the summary does
+        # not need a second decode of the same payload. Durations are
+        # formatted inside jq too - no format_duration subshell fork
+        # per row
         local current_date=""
-        
-        echo "$entries" | jq -r '.[] | .time_entry | "\(.date_at)|\(.minutes)|\(.project_name // "No project")|\(.service_name // "No service")|\(.note // "")"' | while IFS='|' read -r date minutes project service note; do
+        echo "$entries" | jq -r "$JQ_FMTDUR"'
+            (reduce .[] as $e (0; . + ($e.time_entry.minutes // 0))) as $total |
+            (sort_by(.time_entry.date_at)[] | .time_entry | "E|\(.date_at)|\(.minutes | fmtdur)|\(.project_name // "No project")|\(.service_name // "No service")|\(.note // "")"),
+            "T|\($total)|\($total | fmtdur)"' | \
+        while IFS='|' read -r kind date duration project service note; do
+            if [ "$kind" = "T" ]; then
+                # Total row: raw minutes in field 2, formatted in field 3
+                if [ "$date" -gt 0 ] 2>/dev/null; then
+                    echo -e "\n============================================"
+                    echo -e "${BOLD}Total: $duration${NC}"
+                fi
+                continue
+            fi
+
             if [ "$date" != "$current_date" ]; then
                 if [ -n "$current_date" ]; then
                     echo ""
@@ -419,20 +877,12 @@ view_timesheet() {
                 echo -e "\n${CYAN}$date${NC}"
                 current_date="$date"
             fi
-            
-            local duration=$(format_duration $minutes)
+
             echo -e "  ${GREEN}$duration${NC} - $project / $service"
             if [ -n "$note" ]; then
                 echo -e "    ${note:0:60}..."
             fi
         done
-        
-        # Summary
-        total_minutes=$(echo "$entries" | jq '[.[] | .time_entry.minutes] | add // 0')
-        if [ "$total_minutes" -gt 0 ]; then
-            echo -e "\n============================================"
-            echo -e "${BOLD}Total: $(format_duration $total_minutes)${NC}"
-        fi
     fi
 }
 
@@ -464,12 +914,22 @@ Commands:
       --date YYYY-MM-DD            Specific date (default: today)
       --project "name or ID"       Project name or ID
       --service "name or ID"       Service name or ID
+      --no-cache                   Skip the cached project/service lists
     
     Examples:
       $0 add 2h "Worked on feature X"
       $0 add 90m "Bug fixing" --date 2025-01-15
       $0 add 2h "Development" --project "My Project" --service "Programming"
   
+  batch [file]                     Add many entries from a file (or stdin)
+    One entry per line, pipe-separated; date/project/service optional:
+      duration|note|date|project|service
+    Lines starting with # and blank lines are skipped.
+
+    Example:
+      $0 batch month-end.txt
+      echo '2h|Standup and review||Alpha|Programming' | $0 batch
+
   timesheet [filter] [options]     View time entries
     Filters:
       --today                      Today's entries (default)
@@ -489,9 +949,14 @@ Commands:
     Resources:
       projects                     List all projects
       services                     List all services
-  
+
+  cache clear                      Clear cached project/service lists
+
   config                           Configure credentials
 
+Project and service lists are cached in ~/.mite_cache for
+\$MITE_CACHE_TTL seconds (default 1800).
+
 EOF
 }
 
@@ -511,8 +976,6 @@ check_dependencies() {
 
 # Main
 main() {
-    check_dependencies
-    
     case "$1" in
         "config")
             configure
@@ -542,6 +1005,10 @@ main() {
                         service="$2"
                         shift 2
                         ;;
+                    --no-cache)
+                        NO_CACHE=true
+                        shift
+                        ;;
                     *)
                         echo "Unknown option: $1"
                         usage
@@ -549,7 +1016,7 @@ main() {
                         ;;
                 esac
             done
-            
+
             add_entry "$duration" "$note" "$date" "$project" "$service"
             ;;
         "timesheet")
@@ -589,6 +1056,10 @@ main() {
                         project="$2"
                         shift 2
                         ;;
+                    --no-cache)
+                        NO_CACHE=true
+                        shift
+                        ;;
                     *)
                         echo "Unknown option: $1"
                         usage
@@ -596,9 +1067,26 @@ main() {
                         ;;
                 esac
             done
-            
+
             view_timesheet "$filter" "$project"
             ;;
+        "batch")
+            load_config
+            shift
+            add_batch "$@"
+            ;;
+        "cache")
+            case "$2" in
+                "clear")
+                    clear_cache
+                    ;;
+                *)
+                    echo "Unknown cache command: $2"
+                    usage
+                    exit 1
+                    ;;
+            esac
+            ;;
         "list")
             load_config
             case "$2" in
@@ -615,10 +1103,16 @@ main() {
                     ;;
             esac
             ;;
-        *)
+        ""|"help"|"-h"|"--help")
+            # Help costs nothing: no dependency probe, no config load
             usage
             exit 0
             ;;
+        *)
+            echo "Unknown command: $1"
+            usage
+            exit 1
+            ;;
     esac
 }
 